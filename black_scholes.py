@@ -1,131 +1,494 @@
 #!/usr/bin/env python3
 import argparse
+import copy
+import functools
+import math
+from dataclasses import dataclass
 import numpy as np
 from py_vollib.black_scholes import black_scholes as bs
 from py_vollib.black_scholes.greeks.analytical import delta, gamma, theta, vega, rho
-from scipy.stats import norm
-from typing import Tuple, Dict, Optional
+from scipy.special import ndtr
+from typing import Tuple, Dict, Optional, Union
+
+try:
+    from bs_kernel import bs_all, cuda_available, launch_cuda
+except ImportError:  # numba is optional; fall back to the NumPy path
+    bs_all = cuda_available = launch_cuda = None
+
+try:
+    import bs_aot  # ahead-of-time build of the CPU kernel (see build_bs_aot.py), used when numba is not installed
+    _AOT_KERNELS = {np.dtype(np.float64): bs_aot.bs_all_f64, np.dtype(np.float32): bs_aot.bs_all_f32}
+except ImportError:
+    _AOT_KERNELS = {}
+
+# Vectorized wrappers so the py_vollib reference values broadcast like the manual ones.
+_bs_vec = np.vectorize(bs, otypes=[np.float64])
+_delta_vec = np.vectorize(delta, otypes=[np.float64])
+_gamma_vec = np.vectorize(gamma, otypes=[np.float64])
+_theta_vec = np.vectorize(theta, otypes=[np.float64])
+_vega_vec = np.vectorize(vega, otypes=[np.float64])
+_rho_vec = np.vectorize(rho, otypes=[np.float64])
+_PY_VOLLIB_GREEKS = {'Delta': _delta_vec, 'Gamma': _gamma_vec, 'Theta': _theta_vec, 'Vega': _vega_vec, 'Rho': _rho_vec}
+_PY_VOLLIB_ALL = {'Price': _bs_vec, **_PY_VOLLIB_GREEKS}
+
+ArrayLike = Union[float, np.ndarray]
+
+# Inputs of these types take the scalar fast path in BlackScholesModel, with no NumPy setup at all.
+_SCALAR_TYPES = (int, float, np.integer, np.floating)
+
+# 1 / sqrt(2 * pi), the normalising constant of the standard normal pdf.
+_INV_SQRT_2PI = 0.39894228040143268
+_INV_SQRT_2 = 0.7071067811865476
+
+# Price and Greeks over the `_kernel` sub-expressions; each works on floats and on arrays.
+# Theta is per day, Vega and Rho per 1% move.
+_FORMULAS = {
+    'Price': lambda k: k['sgn'] * (k['S'] * k['Nsd1'] - k['K_disc_Nsd2']),
+    'Delta': lambda k: k['sgn'] * k['Nsd1'],
+    'Gamma': lambda k: k['pdf_d1'] / (k['S'] * k['sig_sqrtT']),
+    'Theta': lambda k: (-k['S'] * k['pdf_d1'] * k['sigma'] / (2 * k['sqrtT']) - k['sgn'] * k['r'] * k['K_disc_Nsd2']) / 365,
+    'Vega': lambda k: k['S'] * k['pdf_d1'] * k['sqrtT'] * 0.01,
+    'Rho': lambda k: k['sgn'] * k['T'] * k['K_disc_Nsd2'] * 0.01,
+}
+
+
+def _validate_inputs(S: ArrayLike, K: ArrayLike, T: ArrayLike, sigma: ArrayLike) -> None:
+    """
+    Check the Black-Scholes preconditions once, for every element.
+
+    Floats (the scalar fast path) are compared directly, without NumPy reductions.
+
+    Raises:
+        ValueError: If any price, strike, time to expiration or volatility is not positive.
+    """
+    if isinstance(S, float):
+        prices_ok, terms_ok = S > 0 and K > 0, T > 0 and sigma > 0
+    else:
+        prices_ok = (S > 0).all() and (K > 0).all()
+        terms_ok = (T > 0).all() and (sigma > 0).all()
+    if not prices_ok:
+        raise ValueError("Underlying price and strike price must be positive.")
+    if not terms_ok:
+        raise ValueError("Time to expiration and volatility must be positive.")
+
+
+def _check_backend(backend: str) -> None:
+    """
+    Check that a compute backend is known and usable on this machine.
+
+    Raises:
+        ValueError: If the backend is unknown, or is 'cuda' without numba CUDA support and a GPU.
+    """
+    if backend not in ('cpu', 'cuda'):
+        raise ValueError("Backend must be 'cpu' or 'cuda'")
+    if backend == 'cuda' and (launch_cuda is None or not cuda_available()):
+        raise ValueError("The 'cuda' backend requires numba with CUDA support and a CUDA-capable GPU.")
+
+
+@dataclass
+class OptionBatch:
+    """
+    A portfolio of options stored as a struct of arrays.
+
+    Each field is a contiguous 1-D array with one entry per option (scalars are
+    broadcast), which is the layout the Numba CPU and CUDA kernels read directly.
+    Prices are kept in float32 if S is float32, float64 otherwise; `is_call` is a
+    uint8 mask (1 for Calls, 0 for Puts).
+    """
+    S: np.ndarray
+    K: np.ndarray
+    T: np.ndarray
+    r: np.ndarray
+    sigma: np.ndarray
+    is_call: np.ndarray
+
+    def __post_init__(self):
+        dtype = np.float32 if np.asarray(self.S).dtype == np.float32 else np.float64
+        S, K, T, r, sigma, is_call = np.broadcast_arrays(self.S, self.K, self.T, self.r, self.sigma, self.is_call)
+        self.S = np.ascontiguousarray(S, dtype=dtype).reshape(-1)
+        self.K = np.ascontiguousarray(K, dtype=dtype).reshape(-1)
+        self.T = np.ascontiguousarray(T, dtype=dtype).reshape(-1)
+        self.r = np.ascontiguousarray(r, dtype=dtype).reshape(-1)
+        self.sigma = np.ascontiguousarray(sigma, dtype=dtype).reshape(-1)
+        self.is_call = np.ascontiguousarray(is_call, dtype=np.uint8).reshape(-1)
+        _validate_inputs(self.S, self.K, self.T, self.sigma)
+
+    @classmethod
+    def from_records(cls, df) -> "OptionBatch":
+        """
+        Build a batch from a pandas DataFrame.
+
+        Args:
+            df (pandas.DataFrame): Columns 'S', 'K', 'T', 'r', 'sigma' and 'type' ('c' or 'p').
+
+        Returns:
+            OptionBatch: One entry per row.
+        """
+        columns = (np.ascontiguousarray(df[col].to_numpy(np.float64)) for col in ('S', 'K', 'T', 'r', 'sigma'))
+        return cls(*columns, is_call=BlackScholesModel._is_call(df['type'].to_numpy()))
+
+    def __len__(self) -> int:
+        return self.S.shape[0]
+
+    def _with_call_mask(self, is_call: np.ndarray) -> "OptionBatch":
+        """
+        Return a batch sharing these (already validated) arrays with a different call mask.
+
+        Args:
+            is_call (np.ndarray): Flat call mask (or a scalar) broadcastable to the batch.
+
+        Returns:
+            OptionBatch: The new batch; the price arrays are not copied.
+        """
+        batch = copy.copy(self)
+        batch.is_call = np.ascontiguousarray(np.broadcast_to(is_call, self.S.shape), dtype=np.uint8)
+        return batch
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.S.dtype
+
+    @property
+    def option_type(self) -> np.ndarray:
+        """np.ndarray: 'c'/'p' per option, as accepted by BlackScholesModel."""
+        return np.where(self.is_call, 'c', 'p')
+
+
+def _launch_kernel(batch: OptionBatch, backend: str = 'cpu', approx: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Run the Numba CPU or CUDA kernel over a batch.
+
+    Args:
+        batch (OptionBatch): The options to price.
+        backend (str): 'cpu' or 'cuda'.
+        approx (bool): Use the polynomial normal CDF instead of erfc.
+
+    Returns:
+        Dict[str, np.ndarray]: 'Price', 'Delta', 'Gamma', 'Theta', 'Vega' and 'Rho' arrays.
+    """
+    names = ('Price', 'Delta', 'Gamma', 'Theta', 'Vega', 'Rho')
+    out = {name: np.empty(len(batch), dtype=batch.dtype) for name in names}
+    kernel_args = (batch.S, batch.K, batch.T, batch.r, batch.sigma, batch.is_call, *(out[name] for name in names))
+    if backend == 'cuda':
+        launch_cuda(*kernel_args, approx)
+    elif bs_all is not None:
+        bs_all(*kernel_args, approx)
+    else:
+        # pycc cannot build parallel loops, so the single-threaded AOT kernel is only a fallback for the JIT one.
+        _AOT_KERNELS[batch.dtype](*kernel_args, approx)
+    return out
+
 
 class BlackScholesModel:
     """
     A class to calculate Black-Scholes option prices and Greeks using both
     manual implementation and the py_vollib library.
+
+    All inputs may be scalars or NumPy arrays; they are broadcast against each
+    other so a whole option chain is priced in a single vectorized call.
+
+    Attributes cannot be reassigned and array inputs are stored as read-only views,
+    so create a new model to change a parameter. Values derived from the inputs
+    (including d1 and d2) are cached on first use. Input arrays are not copied:
+    modifying the caller's arrays afterwards is not detected and leaves the model
+    with inconsistent results.
     """
 
-    def __init__(self, S: float, K: float, T: float, r: float, sigma: float):
+    def __init__(self, S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, sigma: ArrayLike,
+                 backend: str = 'cpu', dtype: np.dtype = np.float64, approx: bool = False):
         """
         Initialize the Black-Scholes Model.
 
         Args:
-            S (float): Current price of the underlying asset.
-            K (float): Strike price of the option.
-            T (float): Time to expiration in years.
-            r (float): Risk-free interest rate (decimal, e.g., 0.05 for 5%).
-            sigma (float): Volatility of the underlying asset (decimal, e.g., 0.2 for 20%).
+            S (ArrayLike): Current price of the underlying asset. If S, K, T, r and sigma are all
+                scalars they are stored as plain floats; otherwise as read-only arrays.
+            K (ArrayLike): Strike price of the option.
+            T (ArrayLike): Time to expiration in years.
+            r (ArrayLike): Risk-free interest rate (decimal, e.g., 0.05 for 5%).
+            sigma (ArrayLike): Volatility of the underlying asset (decimal, e.g., 0.2 for 20%).
+            backend (str): 'cpu' for NumPy/Numba, 'cuda' to run the Numba CUDA kernel on the GPU.
+            dtype (np.dtype): np.float64 (default) or np.float32 for a faster single-precision batch path.
+            approx (bool): In the Numba kernels, use a polynomial normal CDF (|error| < 7.5e-8) instead of erfc.
         """
-        if T <= 0 or sigma < 0:
-            raise ValueError("Time to expiration must be positive and volatility must be non-negative.")
-        
-        self.S = S
-        self.K = K
-        self.T = T
-        self.r = r
-        self.sigma = sigma
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be np.float32 or np.float64")
+
+        if all(isinstance(x, _SCALAR_TYPES) for x in (S, K, T, r, sigma)):
+            # Scalar fast path: plain floats and math.* avoid NumPy's dispatch overhead on 0-d arrays.
+            S, K, T, r, sigma = inputs = (float(S), float(K), float(T), float(r), float(sigma))
+            batch, shape = False, ()
+        else:
+            # Read-only views, so the caller's arrays are not frozen along with the model.
+            S, K, T, r, sigma = (np.asarray(x, dtype=dtype).view() for x in (S, K, T, r, sigma))
+            for x in (S, K, T, r, sigma):
+                x.flags.writeable = False
+            shape = np.broadcast(S, K, T, r, sigma).shape
+            batch = shape != ()
+            inputs = (S, K, T, r, sigma) if batch else tuple(float(x) for x in (S, K, T, r, sigma))
+        _validate_inputs(S, K, T, sigma)
+        _check_backend(backend)
 
-    def _calculate_d1_d2(self) -> Tuple[float, float]:
+        # __setattr__ rejects every assignment, so attributes are set once, directly in __dict__.
+        self.__dict__.update(S=S, K=K, T=T, r=r, sigma=sigma, dtype=dtype, backend=backend, approx=approx,
+                             _batch=batch, _shape=shape, _inputs=inputs)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("BlackScholesModel is immutable; create a new model instead.")
+
+    @staticmethod
+    def _is_call(option_type: Union[str, np.ndarray]) -> np.ndarray:
         """
-        Calculate d1 and d2 parameters for Black-Scholes formula.
+        Convert an option type (or array of option types) into a boolean call mask.
+
+        Args:
+            option_type (Union[str, np.ndarray]): 'c' for Call, 'p' for Put.
 
         Returns:
-            Tuple[float, float]: The calculated d1 and d2 values.
+            np.ndarray: True where the option is a Call.
         """
-        d1 = (np.log(self.S / self.K) + (self.r + self.sigma**2 / 2) * self.T) / (self.sigma * np.sqrt(self.T))
-        d2 = d1 - self.sigma * np.sqrt(self.T)
-        return d1, d2
+        if isinstance(option_type, str):
+            if option_type not in ('c', 'p'):
+                raise ValueError("Option type must be 'c' or 'p'")
+            return np.bool_(option_type == 'c')
+        option_type = np.asarray(option_type)
+        if not np.isin(option_type, ('c', 'p')).all():
+            raise ValueError("Option type must be 'c' or 'p'")
+        return option_type == 'c'
 
-    def calculate_price(self, option_type: str = 'c') -> Dict[str, Optional[float]]:
+    @functools.cached_property
+    def _subexpressions(self) -> Dict[str, ArrayLike]:
         """
-        Calculate option price.
+        Compute the input-only sub-expressions (including d1 and d2) once, on first use.
+
+        Chains priced by the Numba or CUDA kernels never need them, so they are not built for those.
+
+        Returns:
+            Dict[str, ArrayLike]: 'sqrtT', 'sig_sqrtT', 'disc', 'd1' and 'd2' (floats for a scalar model).
+        """
+        S, K, T, r, sigma = self._inputs
+        if not self._batch:
+            sqrtT = math.sqrt(T)
+            sig_sqrtT = sigma * sqrtT
+            d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / sig_sqrtT
+            return {'sqrtT': sqrtT, 'sig_sqrtT': sig_sqrtT, 'disc': math.exp(-r * T), 'd1': d1, 'd2': d1 - sig_sqrtT}
+
+        sqrtT = np.sqrt(T)
+        sig_sqrtT = sigma * sqrtT
+        d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / sig_sqrtT
+        return {'sqrtT': sqrtT, 'sig_sqrtT': sig_sqrtT, 'disc': np.exp(-r * T), 'd1': d1, 'd2': d1 - sig_sqrtT}
+
+    def _operands(self) -> Dict[str, ArrayLike]:
+        """
+        Collect the inputs and their sub-expressions for the `_FORMULAS`.
+
+        Returns:
+            Dict[str, ArrayLike]: Arrays (floats for a scalar model) keyed by the names used in the formulas.
+        """
+        S, K, T, r, sigma = self._inputs
+        return {'S': S, 'K': K, 'T': T, 'r': r, 'sigma': sigma, **self._subexpressions}
+
+    def _evaluate(self, name: str, k: Dict[str, ArrayLike]) -> ArrayLike:
+        """
+        Evaluate one of the `_FORMULAS` over the `_kernel` sub-expressions.
+
+        Args:
+            name (str): 'Price', 'Delta', 'Gamma', 'Theta', 'Vega' or 'Rho'.
+            k (Dict[str, ArrayLike]): The output of `_kernel`.
+
+        Returns:
+            ArrayLike: The result in the model's dtype (a NumPy scalar for a scalar model).
+        """
+        value = _FORMULAS[name](k)
+        if not isinstance(k['sgn'], np.ndarray):
+            return self.dtype.type(value)
+        # Gamma and Vega do not depend on the option type, so broadcast them to the shape of the price.
+        value = np.asarray(value, dtype=self.dtype)
+        shape = np.broadcast_shapes(value.shape, k['sgn'].shape)
+        return value if value.shape == shape else np.broadcast_to(value, shape).copy()
+
+    def _calculate_d1_d2(self) -> Tuple[ArrayLike, ArrayLike]:
+        """
+        Return the d1 and d2 parameters for Black-Scholes formula, computed once per model.
+
+        Returns:
+            Tuple[ArrayLike, ArrayLike]: The calculated d1 and d2 values (floats for a scalar model).
+        """
+        return self._subexpressions['d1'], self._subexpressions['d2']
+
+    def _reference_args(self, option_type: Union[str, np.ndarray]) -> tuple:
+        """
+        Build the py_vollib argument tuple; the reference path always runs in float64.
+
+        Args:
+            option_type (Union[str, np.ndarray]): 'c' for Call, 'p' for Put.
+
+        Returns:
+            tuple: (option_type, S, K, T, r, sigma) with float64 arrays.
+        """
+        return (option_type, *(np.asarray(x, dtype=np.float64) for x in (self.S, self.K, self.T, self.r, self.sigma)))
+
+    def _use_jit(self, option_type: Union[str, np.ndarray]) -> bool:
+        """
+        Decide whether to route the calculation to the Numba batch kernel.
+
+        Args:
+            option_type (Union[str, np.ndarray]): 'c' for Call, 'p' for Put.
+
+        Returns:
+            bool: True on the CUDA backend, or if a compiled CPU kernel is available and the inputs form a chain.
+        """
+        if self.backend == 'cuda':
+            return True
+        has_cpu_kernel = bs_all is not None or bool(_AOT_KERNELS)
+        return has_cpu_kernel and (self._batch or (not isinstance(option_type, str) and np.ndim(option_type) > 0))
+
+    @functools.cached_property
+    def _option_batch(self) -> OptionBatch:
+        """
+        The inputs as a contiguous, validated OptionBatch, built once and shared by every kernel call.
+
+        The call mask is a placeholder; `_jit_all` swaps in the requested one.
+        """
+        inputs = (np.asarray(x, dtype=self.dtype) for x in (self.S, self.K, self.T, self.r, self.sigma))
+        return OptionBatch(*inputs, is_call=np.uint8(1))
+
+    def _jit_all(self, option_type: Union[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Compute price and all Greeks for a chain with the Numba CPU or CUDA kernel.
+
+        Args:
+            option_type (Union[str, np.ndarray]): 'c' for Call, 'p' for Put (or an array of them).
+
+        Returns:
+            Dict[str, np.ndarray]: 'Price', 'Delta', 'Gamma', 'Theta', 'Vega' and 'Rho' arrays.
+        """
+        is_call = self._is_call(option_type)
+        shape = np.broadcast_shapes(self._shape, is_call.shape)
+        if shape == self._shape:
+            batch = self._option_batch._with_call_mask(np.broadcast_to(is_call, shape).reshape(-1))
+        else:
+            # The option types extend the inputs (e.g. one scalar option priced as both a Call and a Put).
+            inputs = (np.asarray(x, dtype=self.dtype) for x in (self.S, self.K, self.T, self.r, self.sigma))
+            batch = OptionBatch(*inputs, is_call)
+        out = _launch_kernel(batch, self.backend, self.approx)
+        return {name: values.reshape(shape)[()] for name, values in out.items()}
+
+    def _kernel(self, option_type: str = 'c') -> Dict[str, np.ndarray]:
+        """
+        Compute the sub-expressions shared by the price and every Greek, once.
 
         Args:
-            option_type (str): 'c' for Call, 'p' for Put.
+            option_type (str): 'c' for Call, 'p' for Put (or an array of them).
 
         Returns:
-            Dict[str, Optional[float]]: Prices from 'Manual' calculation and 'Py_Vollib'.
+            Dict[str, np.ndarray]: The `_operands` plus 'sgn' (+1 Call, -1 Put), d1, d2,
+            N(sign*d1), N(sign*d2), the standard normal pdf at d1 and the discounted
+            strike term K*exp(-rT)*N(sign*d2) shared by the price, Theta and Rho.
         """
+        is_call = self._is_call(option_type)
+        k = self._operands()
         d1, d2 = self._calculate_d1_d2()
-        try:
-            if option_type == 'c':
-                price = self.S * norm.cdf(d1, 0, 1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2, 0, 1)
-            elif option_type == 'p':
-                price = self.K * np.exp(-self.r * self.T) * norm.cdf(-d2, 0, 1) - self.S * norm.cdf(-d1, 0, 1)
-            else:
-                raise ValueError("Option type must be 'c' or 'p'")
-            
-            lib_price = bs(option_type, self.S, self.K, self.T, self.r, self.sigma)
-            return {"Manual": price, "Py_Vollib": lib_price}
-        except Exception as e:
-            print(f"Error calculating price: {e}")
-            return {"Manual": None, "Py_Vollib": None}
+        # Evaluating N at sign*d (rather than 1 - N(d) for Puts) keeps full precision deep out of the money.
+        if not self._batch and is_call.ndim == 0:
+            sgn = k['sgn'] = 1.0 if is_call else -1.0
+            # N(x) = erfc(-x / sqrt(2)) / 2, without a ufunc call on a Python float.
+            k['Nsd1'] = 0.5 * math.erfc(-sgn * d1 * _INV_SQRT_2)
+            k['Nsd2'] = Nsd2 = 0.5 * math.erfc(-sgn * d2 * _INV_SQRT_2)
+            k['pdf_d1'] = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+            k['K_disc_Nsd2'] = k['K'] * k['disc'] * Nsd2
+            return k
+
+        k['sgn'] = np.where(is_call, 1.0, -1.0).astype(self.dtype)
+        k['Nsd1'] = ndtr(k['sgn'] * d1)
+        k['Nsd2'] = ndtr(k['sgn'] * d2)
+        k['pdf_d1'] = _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+        k['K_disc_Nsd2'] = k['K'] * k['disc'] * k['Nsd2']
+        return k
+
+    def calculate_price(self, option_type: str = 'c', verify: bool = False) -> Dict[str, Optional[ArrayLike]]:
+        """
+        Calculate option price.
+
+        Args:
+            option_type (str): 'c' for Call, 'p' for Put (or an array of them).
+            verify (bool): Also compute the py_vollib reference price (slow, for validation only).
+
+        Returns:
+            Dict[str, Optional[ArrayLike]]: Prices from 'Manual' calculation and 'Py_Vollib'.
+        """
+        if self._use_jit(option_type):
+            price = self._jit_all(option_type)['Price']
+        else:
+            price = self._evaluate('Price', self._kernel(option_type))
+
+        lib_price = _bs_vec(*self._reference_args(option_type))[()] if verify else None
+        return {"Manual": price, "Py_Vollib": lib_price}
 
-    def calculate_greeks(self, option_type: str = 'c') -> Dict[str, Dict[str, Optional[float]]]:
+    def calculate_greeks(self, option_type: str = 'c', verify: bool = False) -> Dict[str, Dict[str, Optional[ArrayLike]]]:
         """
         Calculate all Greeks (Delta, Gamma, Theta, Vega, Rho).
 
         Args:
-            option_type (str): 'c' for Call, 'p' for Put.
+            option_type (str): 'c' for Call, 'p' for Put (or an array of them).
+            verify (bool): Also compute the py_vollib reference Greeks (slow, for validation only).
 
         Returns:
-            Dict[str, Dict[str, Optional[float]]]: Dictionary containing Greeks from both methods.
+            Dict[str, Dict[str, Optional[ArrayLike]]]: Dictionary containing Greeks from both methods.
         """
-        d1, d2 = self._calculate_d1_d2()
-        greeks = {}
-
-        # Delta
-        try:
-            if option_type == 'c':
-                delta_val = norm.cdf(d1, 0, 1)
-            else:
-                delta_val = -norm.cdf(-d1, 0, 1)
-            greeks['Delta'] = {"Manual": delta_val, "Py_Vollib": delta(option_type, self.S, self.K, self.T, self.r, self.sigma)}
-        except Exception: 
-            greeks['Delta'] = {"Manual": None, "Py_Vollib": None}
-
-        # Gamma
-        try:
-            gamma_val = norm.pdf(d1, 0, 1) / (self.S * self.sigma * np.sqrt(self.T))
-            greeks['Gamma'] = {"Manual": gamma_val, "Py_Vollib": gamma(option_type, self.S, self.K, self.T, self.r, self.sigma)}
-        except Exception:
-            greeks['Gamma'] = {"Manual": None, "Py_Vollib": None}
-
-        # Theta
-        try:
-            if option_type == 'c':
-                theta_val = -self.S * norm.pdf(d1, 0, 1) * self.sigma / (2 * np.sqrt(self.T)) - self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(d2, 0, 1)
-            else:
-                theta_val = -self.S * norm.pdf(d1, 0, 1) * self.sigma / (2 * np.sqrt(self.T)) + self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-d2, 0, 1)
-            greeks['Theta'] = {"Manual": theta_val / 365, "Py_Vollib": theta(option_type, self.S, self.K, self.T, self.r, self.sigma)}
-        except Exception:
-            greeks['Theta'] = {"Manual": None, "Py_Vollib": None}
-
-        # Vega
-        try:
-            vega_val = self.S * norm.pdf(d1, 0, 1) * np.sqrt(self.T)
-            greeks['Vega'] = {"Manual": vega_val * 0.01, "Py_Vollib": vega(option_type, self.S, self.K, self.T, self.r, self.sigma)}
-        except Exception:
-            greeks['Vega'] = {"Manual": None, "Py_Vollib": None}
-
-        # Rho
-        try:
-            if option_type == 'c':
-                rho_val = self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(d2, 0, 1)
-            else:
-                rho_val = -self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(-d2, 0, 1)
-            greeks['Rho'] = {"Manual": rho_val * 0.01, "Py_Vollib": rho(option_type, self.S, self.K, self.T, self.r, self.sigma)}
-        except Exception:
-            greeks['Rho'] = {"Manual": None, "Py_Vollib": None}
-
-        return greeks
+        args = self._reference_args(option_type) if verify else None
+        if self._use_jit(option_type):
+            values = self._jit_all(option_type)
+        else:
+            # Inputs are validated in __init__, so every Greek is straight-line arithmetic.
+            k = self._kernel(option_type)
+            values = {name: self._evaluate(name, k) for name in _PY_VOLLIB_GREEKS}
+        return {name: {"Manual": values[name], "Py_Vollib": ref(*args)[()] if verify else None}
+                for name, ref in _PY_VOLLIB_GREEKS.items()}
+
+    def calculate_all(self, option_type: str = 'c', verify: bool = False) -> Dict[str, Dict[str, Optional[ArrayLike]]]:
+        """
+        Calculate the price and all Greeks from a single evaluation of the shared kernel.
+
+        Args:
+            option_type (str): 'c' for Call, 'p' for Put (or an array of them).
+            verify (bool): Also compute the py_vollib reference values (slow, for validation only).
+
+        Returns:
+            Dict[str, Dict[str, Optional[ArrayLike]]]: 'Price', 'Delta', 'Gamma', 'Theta', 'Vega' and 'Rho',
+            each with 'Manual' and 'Py_Vollib' values.
+        """
+        args = self._reference_args(option_type) if verify else None
+        if self._use_jit(option_type):
+            values = self._jit_all(option_type)
+        else:
+            k = self._kernel(option_type)
+            values = {name: self._evaluate(name, k) for name in _FORMULAS}
+        return {name: {"Manual": values[name], "Py_Vollib": ref(*args)[()] if verify else None}
+                for name, ref in _PY_VOLLIB_ALL.items()}
+
+
+def price_batch(batch: OptionBatch, backend: str = 'cpu', approx: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Price a batch and compute all its Greeks.
+
+    Uses the fused Numba kernel when available and the NumPy path otherwise.
+
+    Args:
+        batch (OptionBatch): The options to price.
+        backend (str): 'cpu' or 'cuda'.
+        approx (bool): Use the polynomial normal CDF in the Numba kernels.
+
+    Returns:
+        Dict[str, np.ndarray]: 'Price', 'Delta', 'Gamma', 'Theta', 'Vega' and 'Rho' arrays.
+    """
+    _check_backend(backend)
+    if backend == 'cuda' or bs_all is not None or _AOT_KERNELS:
+        return _launch_kernel(batch, backend, approx)
+    # The batch is already validated; only the NumPy fallback needs a model.
+    model = BlackScholesModel(batch.S, batch.K, batch.T, batch.r, batch.sigma, dtype=batch.dtype)
+    return {name: values['Manual'] for name, values in model.calculate_all(batch.option_type).items()}
+
 
 def main():
     parser = argparse.ArgumentParser(description="Calculate Black-Scholes Option Price and Greeks.")
@@ -135,6 +498,7 @@ def main():
     parser.add_argument("--time", type=float, default=30, help="Time to expiration in days. Default: 30")
     parser.add_argument("--volatility", type=float, default=0.35, help="Volatility (sigma). Default: 0.35")
     parser.add_argument("--type", type=str, choices=['c', 'p'], default='c', help="Option type: 'c' for Call, 'p' for Put. Default: 'c'")
+    parser.add_argument("--backend", type=str, choices=['cpu', 'cuda'], default='cpu', help="Compute backend. Default: 'cpu'")
 
     args = parser.parse_args()
 
@@ -145,14 +509,13 @@ def main():
     print(f"Parameters: S={args.price}, K={args.strike}, r={args.rate}, T={T_years:.4f} ({args.time} days), sigma={args.volatility}")
     print(f"Option Type: {'Call' if args.type == 'c' else 'Put'}\n")
 
-    model = BlackScholesModel(args.price, args.strike, T_years, args.rate, args.volatility)
+    model = BlackScholesModel(args.price, args.strike, T_years, args.rate, args.volatility, backend=args.backend)
     
-    # Calculate Price
-    prices = model.calculate_price(args.type)
+    # Calculate Price and Greeks in one pass
+    greeks = model.calculate_all(args.type, verify=True)
+    prices = greeks.pop('Price')
     print(f"Option Price:\n  Manual:    {prices['Manual']}\n  Py_Vollib: {prices['Py_Vollib']}\n")
 
-    # Calculate Greeks
-    greeks = model.calculate_greeks(args.type)
     for name, values in greeks.items():
         print(f"{name}:\n  Manual:    {values['Manual']}\n  Py_Vollib: {values['Py_Vollib']}\n")
 
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Compile the Numba CPU kernel ahead of time into the `bs_aot` extension module.
+
+The extension does not need numba at run time, so deployments without numba
+still price chains with compiled code instead of the NumPy fallback. pycc
+cannot build parallel loops, so the exported kernels are single-threaded and
+black_scholes.py prefers the JIT-compiled `bs_all` whenever numba is installed.
+Run once per machine (or when packaging a wheel):
+
+    python build_bs_aot.py
+"""
+from numba.pycc import CC
+
+from bs_kernel import bs_all
+
+cc = CC('bs_aot')
+
+_SIGNATURE = 'void({f}[:], {f}[:], {f}[:], {f}[:], {f}[:], u1[:], {f}[:], {f}[:], {f}[:], {f}[:], {f}[:], {f}[:], b1)'
+
+# One exported symbol per precision, with the same arguments as bs_kernel.bs_all.
+cc.export('bs_all_f64', _SIGNATURE.format(f='f8'))(bs_all.py_func)
+cc.export('bs_all_f32', _SIGNATURE.format(f='f4'))(bs_all.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,130 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+from scipy.special import ndtr
+
+import black_scholes
+from black_scholes import BlackScholesModel, OptionBatch, price_batch
+
+# A mixed call/put chain across moneyness, expiries and volatilities.
+S = np.array([80.0, 95.0, 100.0, 105.0, 120.0, 100.0])
+K = np.array([100.0, 100.0, 100.0, 100.0, 100.0, 60.0])
+T = np.array([0.1, 0.25, 0.5, 1.0, 2.0, 0.75])
+R = 0.03
+SIGMA = np.array([0.15, 0.2, 0.25, 0.3, 0.45, 0.35])
+TYPES = np.array(['c', 'p', 'c', 'p', 'c', 'p'])
+
+
+@pytest.fixture(params=['jit', 'numpy'])
+def path(request, monkeypatch):
+    """Run a test on the Numba kernel and on the NumPy fallback."""
+    if request.param == 'jit':
+        if black_scholes.bs_all is None:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(black_scholes, 'bs_all', None)
+        monkeypatch.setattr(black_scholes, '_AOT_KERNELS', {})
+    return request.param
+
+
+def _assert_matches_py_vollib(values, atol):
+    for name, pair in values.items():
+        np.testing.assert_allclose(pair['Manual'], pair['Py_Vollib'], rtol=0, atol=atol, err_msg=name)
+
+
+def test_chain_matches_py_vollib(path):
+    model = BlackScholesModel(S, K, T, R, SIGMA)
+    values = model.calculate_all(TYPES, verify=True)
+    assert values['Price']['Manual'].shape == S.shape
+    _assert_matches_py_vollib(values, atol=1e-12)
+
+
+def test_scalar_matches_py_vollib(path):
+    model = BlackScholesModel(34.03, 40.0, 30 / 365, 0.0412, 0.35)
+    for option_type in ('c', 'p'):
+        _assert_matches_py_vollib(model.calculate_all(option_type, verify=True), atol=1e-12)
+
+
+def test_deep_otm_put_keeps_precision(path):
+    # N(-d) is evaluated directly; 1 - N(d) would round the put price to zero.
+    S_, K_, T_, r_, sigma_ = 100.0, np.array([20.0, 30.0]), 0.5, 0.03, 0.2
+    d1 = (np.log(S_ / K_) + (r_ + 0.5 * sigma_ ** 2) * T_) / (sigma_ * np.sqrt(T_))
+    d2 = d1 - sigma_ * np.sqrt(T_)
+    expected = K_ * np.exp(-r_ * T_) * ndtr(-d2) - S_ * ndtr(-d1)
+
+    price = BlackScholesModel(S_, K_, T_, r_, sigma_).calculate_price('p')['Manual']
+    assert (price > 0).all()
+    np.testing.assert_allclose(price, expected, rtol=1e-9)
+
+
+def test_float32_chain(path):
+    model = BlackScholesModel(S, K, T, R, SIGMA, dtype=np.float32)
+    values = model.calculate_all(TYPES, verify=True)
+    assert values['Price']['Manual'].dtype == np.float32
+    _assert_matches_py_vollib(values, atol=1e-4)
+
+
+def test_option_batch_from_records(path):
+    pd = pytest.importorskip('pandas')
+    df = pd.DataFrame({'S': S, 'K': K, 'T': T, 'r': R, 'sigma': SIGMA, 'type': TYPES})
+    batch = OptionBatch.from_records(df)
+    assert len(batch) == len(df)
+    assert batch.is_call.dtype == np.uint8
+    np.testing.assert_array_equal(batch.option_type, TYPES)
+
+    values = price_batch(batch)
+    expected = BlackScholesModel(S, K, T, R, SIGMA).calculate_all(TYPES)
+    for name, pair in expected.items():
+        np.testing.assert_allclose(values[name], pair['Manual'], rtol=1e-12, atol=1e-14, err_msg=name)
+
+
+def test_approx_cdf():
+    if black_scholes.bs_all is None:
+        pytest.skip("numba is not installed")
+    model = BlackScholesModel(S, K, T, R, SIGMA, approx=True)
+    _assert_matches_py_vollib(model.calculate_all(TYPES, verify=True), atol=1e-4)
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        BlackScholesModel(100.0, 100.0, 0.5, 0.03, 0.0)
+    with pytest.raises(ValueError):
+        BlackScholesModel(100.0, 100.0, 0.5, 0.03, 0.2, backend='tpu')
+
+
+def test_invalid_option_type_raises(path):
+    for model in (BlackScholesModel(100.0, 100.0, 0.5, 0.03, 0.2), BlackScholesModel(S, K, T, R, SIGMA)):
+        for method in (model.calculate_price, model.calculate_greeks, model.calculate_all):
+            with pytest.raises(ValueError):
+                method('x')
+
+
+def test_option_types_broadcast_against_chain(path):
+    model = BlackScholesModel(S, K, T, R, SIGMA)
+    for option_type in ('p', TYPES, np.array([['c'], ['p']])):
+        values = model.calculate_all(option_type, verify=True)
+        assert values['Price']['Manual'].shape == np.broadcast_shapes(S.shape, np.shape(option_type))
+        _assert_matches_py_vollib(values, atol=1e-12)
+
+
+def test_cuda_backend_under_simulator():
+    if black_scholes.bs_all is None:
+        pytest.skip("numba is not installed")
+    # The simulator must be enabled before numba.cuda is imported, so run in a fresh interpreter.
+    script = textwrap.dedent("""
+        import numpy as np
+        from black_scholes import BlackScholesModel
+        from test_black_scholes import S, K, T, R, SIGMA, TYPES, _assert_matches_py_vollib
+
+        for dtype, approx, atol in ((np.float64, False, 1e-12), (np.float32, False, 1e-4), (np.float64, True, 1e-4)):
+            model = BlackScholesModel(S, K, T, R, SIGMA, backend='cuda', dtype=dtype, approx=approx)
+            values = model.calculate_all(TYPES, verify=True)
+            assert values['Price']['Manual'].dtype == dtype
+            _assert_matches_py_vollib(values, atol=atol)
+    """)
+    env = {**os.environ, 'NUMBA_ENABLE_CUDASIM': '1'}
+    subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(os.path.abspath(__file__)), env=env, check=True)